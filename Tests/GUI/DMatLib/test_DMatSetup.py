@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+import pytest
+from PySide2 import QtWidgets
+
+from pyleecan.Classes.Material import Material
+from pyleecan.GUI.Dialog.DMatLib.DMatSetup.DMatSetup import DMatSetup
+
+
+class TestDMatSetup(object):
+    """Test that the widget DMatSetup behave like it should"""
+
+    @classmethod
+    def setup_class(cls):
+        """Start the app for the test"""
+        print("\nStart Test TestDMatSetup")
+        if not QtWidgets.QApplication.instance():
+            cls.app = QtWidgets.QApplication(sys.argv)
+        else:
+            cls.app = QtWidgets.QApplication.instance()
+
+    def setup_method(self):
+        """Run at the begining of every test to setup the gui"""
+        self.material = Material(name="test_material")
+        self.material.struct.Ex = 2e11
+        self.material.HT.lambda_x = 20
+        self.material.struct.nu_xy = 0.3
+        self.widget = DMatSetup(material=self.material)
+
+    @classmethod
+    def teardown_class(cls):
+        """Exit the app after the test"""
+        cls.app.quit()
+
+    def test_init(self):
+        """Check that the widgets are set according to the material"""
+        assert self.widget.lf_E.value() == pytest.approx(200)
+        assert self.widget.lf_Ex.value() == pytest.approx(200)
+        assert self.widget.lf_L.value() == 20
+        assert self.widget.lf_Lx.value() == 20
+        assert self.widget.lf_nu.value() == 0.3
+        assert self.widget.lf_nu_xy.value() == 0.3
+
+    @pytest.mark.parametrize(
+        "widget_name, text, attr_list, value",
+        [
+            ("lf_E", "150", ["Ex", "Ey", "Ez"], 150e9),
+            ("lf_G", "80", ["Gxy", "Gxz", "Gyz"], 80e9),
+            ("lf_nu", "0.25", ["nu_xy", "nu_xz", "nu_yz"], 0.25),
+        ],
+    )
+    def test_set_struct(self, widget_name, text, attr_list, value):
+        """Check that editing a mirrored field updates all the attributes"""
+        widget = getattr(self.widget, widget_name)
+        widget.setText(text)
+        widget.editingFinished.emit()
+
+        for attr in attr_list:
+            assert getattr(self.material.struct, attr) == pytest.approx(value)
+        assert self.widget.is_save_needed
+
+    def test_set_lambda(self):
+        """Check that editing lf_L updates the 3 thermal conductivities"""
+        self.widget.lf_L.setText("35")
+        self.widget.lf_L.editingFinished.emit()
+
+        assert self.material.HT.lambda_x == 35
+        assert self.material.HT.lambda_y == 35
+        assert self.material.HT.lambda_z == 35
+        assert self.widget.is_save_needed
+
+    def test_set_single(self):
+        """Check that editing a single field only updates its attribute"""
+        self.widget.lf_Ey.setText("100")
+        self.widget.lf_Ey.editingFinished.emit()
+
+        assert self.material.struct.Ey == pytest.approx(100e9)
+        assert self.material.struct.Ex == pytest.approx(2e11)
+        assert self.material.struct.Ez != pytest.approx(100e9)
+
+    def test_set_same_value(self):
+        """Check that an unchanged value doesn't require a save"""
+        self.widget.lf_E.setText("200")
+        self.widget.lf_E.editingFinished.emit()
+
+        assert not self.widget.is_save_needed
@@ -20,6 +20,7 @@ from ...Functions.GMSH.get_sliding_band import get_sliding_band
 from ...Functions.GMSH.get_air_box import get_air_box
 from ...Functions.GMSH.get_boundary_condition import get_boundary_condition
 from ...Functions.GMSH.draw_surf_line import draw_surf_line
+from ...Functions.GMSH.gen_3D_mesh import close_gmsh_session
 import sys
 import gmsh
 import cmath
@@ -97,6 +98,7 @@ def draw_GMSH(
     factory = model.geo
 
     # Start a new model
+    close_gmsh_session()  # Don't reuse the gen_3D_mesh session
     gmsh.initialize()
     gmsh.option.setNumber("General.Terminal", int(False))
     gmsh.option.setNumber("Geometry.CopyMeshingMethod", 1)
@@ -1,10 +1,28 @@
-from os import replace
-from numpy import pi
-from ...Classes.Arc import Arc
-import sys
-import gmsh
+import atexit
+from os import replace, cpu_count
+from math import pi
 from os.path import splitext
 
+# True while a gmsh session is kept open by gen_3D_mesh (reuse_session=True)
+_is_gmsh_init = False
+
+
+def close_gmsh_session():
+    """Finalize the gmsh session kept open by gen_3D_mesh (if any)
+
+    Must be called before any other gmsh.initialize so that the other gmsh
+    users start from a new session.
+    """
+    global _is_gmsh_init
+    if _is_gmsh_init:
+        import gmsh
+
+        gmsh.finalize()
+        _is_gmsh_init = False
+
+
+atexit.register(close_gmsh_session)
+
 
 def gen_3D_mesh(
     lamination,
@@ -14,7 +32,10 @@ def gen_3D_mesh(
     user_mesh_dict=None,
     is_rect=False,
     Nlayer=20,
-    display=True,
+    display=False,
+    n_threads=None,
+    is_binary=True,
+    reuse_session=False,
 ):
     """Draw 3D mesh of the lamination
     Parameters
@@ -34,11 +55,26 @@ def gen_3D_mesh(
     Nlayer : int
         Number of mesh layer on Z axis
     display : bool
-        To display gmsh logs
+        To display gmsh logs in the terminal
+    n_threads : int
+        Number of threads used by gmsh (None to use all the CPUs)
+    is_binary : bool
+        To save the msh file in binary format (else ASCII)
+    reuse_session : bool
+        To keep the gmsh session open for the next calls (closed at exit or by
+        close_gmsh_session). Depending on the gmsh version, Ctrl-C no longer
+        raises KeyboardInterrupt until the session is finalized.
     Returns
     -------
     None
     """
+    filename, file_extension = splitext(save_path)
+
+    # gmsh (and OCC) is only loaded when a mesh is generated
+    import gmsh
+    from numpy import fromiter, complex128
+    from ...Classes.Arc import Arc
+
     # The defaut symmetry is Zs => We draw only one tooth
     if sym == -1:
         tooth_surf = lamination.slot.get_surface_tooth()
@@ -46,106 +82,145 @@ def gen_3D_mesh(
     else:
         tooth_surf = lamination.build_geometry(sym=sym)[0]
         Zs = sym
+    lines = tooth_surf.get_lines()
+    n_lines = len(lines)
 
     # For readibility
     model = gmsh.model
     factory = model.geo
     L = lamination.L1  # Lamination length
 
-    # Start a new model
-    gmsh.initialize()
-
-    gmsh.option.setNumber("General.Terminal", int(display))
-
-    gmsh.option.setNumber("Geometry.CopyMeshingMethod", 1)
-    model.add("Pyleecan")
-
-    # Create all the points of the tooth
-    NPoint = 0  # Number of point created
-    for line in tooth_surf.get_lines():
-        Z = line.get_begin()
-        NPoint += 1
-        factory.addPoint(Z.real, Z.imag, -L / 2, mesh_size, NPoint)
-
-    # Draw all the lines of the tooth
-    NLine = 0  # Number of line created
-    for line in tooth_surf.get_lines():
-        NLine += 1
-        if NLine == len(tooth_surf.get_lines()):
-            if isinstance(line, Arc):
-                Zc = line.get_center()
-                NPoint += 1
-                factory.addPoint(Zc.real, Zc.imag, -L / 2, mesh_size, NPoint)
-                factory.addCircleArc(NLine, NPoint - 1, 1, NLine)
-            else:
-                factory.addLine(NLine, 1, NLine)
-        else:
-            if isinstance(line, Arc):
+    # Start a new model (reuse the session left open by a previous call)
+    global _is_gmsh_init
+    if _is_gmsh_init:
+        gmsh.clear()
+    else:
+        gmsh.initialize()
+
+    if n_threads is None:
+        n_threads = cpu_count() or 1
+    # Options of this call, restored at the end so that they don't leak to
+    # the other users of the gmsh session
+    option_dict = {
+        "General.Terminal": int(display),
+        # Only errors and warnings when not displayed (5 is gmsh default)
+        "General.Verbosity": 5 if display else 2,
+        # Threads for the parallel steps of gmsh (the volumes are extruded
+        # layers, the 3D algorithm is not used)
+        "General.NumThreads": n_threads,
+        "Geometry.CopyMeshingMethod": 1,
+        # .msh2 files use the msh 2.2 format, the others msh 4.1
+        "Mesh.MshFileVersion": 2.2 if file_extension == ".msh2" else 4.1,
+        "Mesh.Binary": int(is_binary),
+    }
+    init_option_dict = {name: gmsh.option.getNumber(name) for name in option_dict}
+    for name, value in option_dict.items():
+        gmsh.option.setNumber(name, value)
+
+    try:
+        model.add("Pyleecan")
+
+        # Bind the geometry functions used in the loops
+        addPoint = factory.addPoint
+        addLine = factory.addLine
+        addCircleArc = factory.addCircleArc
+        copy = factory.copy
+        rotate = factory.rotate
+
+        # Create all the points of the tooth
+        Z_begin = fromiter(
+            (line.get_begin() for line in lines), dtype=complex128, count=n_lines
+        )
+        X_begin, Y_begin = Z_begin.real.tolist(), Z_begin.imag.tolist()
+        for ii in range(n_lines):
+            addPoint(X_begin[ii], Y_begin[ii], -L / 2, mesh_size, ii + 1)
+        NPoint = n_lines  # Number of point created
+
+        # Draw all the lines of the tooth
+        is_arc = [isinstance(line, Arc) for line in lines]
+        arc_list = list()  # (tag, begin, center, end) of each arc
+        NLine = 0  # Number of line created
+        for line in lines:
+            NLine += 1
+            # The last line ends on the first point
+            end = 1 if NLine == n_lines else NLine + 1
+            if is_arc[NLine - 1]:
                 Zc = line.get_center()
                 NPoint += 1
-                factory.addPoint(Zc.real, Zc.imag, -L / 2, mesh_size, NPoint)
-                factory.addCircleArc(NLine, NPoint, NLine + 1, NLine)
+                addPoint(Zc.real, Zc.imag, -L / 2, mesh_size, NPoint)
+                arc_list.append((NLine, NLine, NPoint, end))
             else:
-                factory.addLine(NLine, NLine + 1, NLine)
-
-    # Create the Tooth surface
-    gmsh.model.geo.addCurveLoop(list(range(1, NLine + 1)), 1)
-    gmsh.model.geo.addPlaneSurface([1], 1)
-    gmsh.model.addPhysicalGroup(2, [1], 1)
-    gmsh.model.setPhysicalName(2, 1, "Tooth")
-
-    # convert triangle mesh to rectangle mesh
-    if is_rect:
-        factory.mesh.setRecombine(2, 1)
-
-    # Change the mesh size for each line
-    if user_mesh_dict is not None:
-        # Compute basic mesh_dict
-        mesh_dict = tooth_surf.comp_mesh_dict(element_size=mesh_size)
-        # Overwrite basic mesh dict with user one
-        mesh_dict.update(user_mesh_dict)
-        # Apply the number of element on each line of the surface
-        for ii, line in enumerate(tooth_surf.get_lines()):
-            factory.mesh.setTransfiniteCurve(
-                ii + 1, mesh_dict[str(ii)] + 1, "Progression"
-            )
-
-    # Copy/Rotate all the tooth to get the 2D lamination
-    surf_list = [1]
-    for ii in range(Zs):
-        ov = factory.copy([(2, 1)])
-        factory.rotate(ov, 0, 0, -L / 2, 0, 0, 1, (ii + 1) * 2 * pi / Zs)
-        surf_list.append(ov[0][1])
-    gmsh.model.addPhysicalGroup(2, surf_list, 2)
-    gmsh.model.setPhysicalName(2, 2, "Lamination")
-
-    # Extrude the lamination
-    for surf in surf_list:
-        if is_rect == True:
-            ov = factory.extrude(
-                [(2, surf)], 0, 0, L, numElements=[Nlayer], recombine=True
-            )
+                addLine(NLine, end, NLine)
+        for tag, begin, center, end in arc_list:
+            addCircleArc(begin, center, end, tag)
+
+        # Create the Tooth surface
+        gmsh.model.geo.addCurveLoop(list(range(1, NLine + 1)), 1)
+        gmsh.model.geo.addPlaneSurface([1], 1)
+
+        # convert triangle mesh to rectangle mesh
+        if is_rect:
+            factory.mesh.setRecombine(2, 1)
+
+        # Change the mesh size for each line
+        if user_mesh_dict is not None:
+            # Compute basic mesh_dict
+            mesh_dict = tooth_surf.comp_mesh_dict(element_size=mesh_size)
+            # Overwrite basic mesh dict with user one
+            mesh_dict.update(user_mesh_dict)
+            # Apply the number of element on each line of the surface
+            for ii in range(n_lines):
+                factory.mesh.setTransfiniteCurve(
+                    ii + 1, mesh_dict[str(ii)] + 1, "Progression"
+                )
+
+        # Copy/Rotate all the tooth to get the 2D lamination
+        angle_list = [(ii + 1) * 2 * pi / Zs for ii in range(Zs)]
+        surf_list = [1]
+        for angle in angle_list:
+            ov = copy([(2, 1)])
+            rotate(ov, 0, 0, -L / 2, 0, 0, 1, angle)
+            surf_list.append(ov[0][1])
+
+        # Extrude the lamination
+        factory.extrude(
+            [(2, surf) for surf in surf_list],
+            0,
+            0,
+            L,
+            numElements=[Nlayer],
+            recombine=is_rect,
+        )
+
+        # Build the model once all the geometry is defined
+        factory.synchronize()
+
+        # Define the physical groups on the synchronized model
+        model.addPhysicalGroup(2, [1], 1)
+        model.setPhysicalName(2, 1, "Tooth")
+        model.addPhysicalGroup(2, surf_list, 2)
+        model.setPhysicalName(2, 2, "Lamination")
+        model.addPhysicalGroup(3, list(range(1, Zs + 1)), 1)
+        if lamination.is_stator:
+            model.setPhysicalName(3, 1, "stator")
         else:
-            ov = factory.extrude(
-                [(2, surf)], 0, 0, L, numElements=[Nlayer], recombine=False
-            )
-    model.addPhysicalGroup(3, list(range(1, Zs + 1)), 1)
-    if lamination.is_stator:
-        model.setPhysicalName(3, 1, "stator")
-    else:
-        model.setPhysicalName(3, 1, "rotor")
+            model.setPhysicalName(3, 1, "rotor")
 
-    # Generate the 3D mesh
-    factory.synchronize()
-
-    filename, file_extension = splitext(save_path)
-    if file_extension == ".geo":
-        gmsh.write(filename + ".geo_unrolled")
-        replace(filename + ".geo_unrolled", filename + file_extension)
-    else:
-        gmsh.model.mesh.generate(3)
-        gmsh.write(save_path)
-
-    # Save and close
-
-    gmsh.finalize()
+        # Generate the 3D mesh
+        if file_extension == ".geo":
+            gmsh.write(filename + ".geo_unrolled")
+            replace(filename + ".geo_unrolled", filename + file_extension)
+        else:
+            gmsh.model.mesh.generate(3)
+            gmsh.write(save_path)
+    finally:
+        # Restore the options for the other users of the session
+        for name, value in init_option_dict.items():
+            gmsh.option.setNumber(name, value)
+        if reuse_session:
+            # Release the model but keep the session for the next calls
+            gmsh.clear()
+            _is_gmsh_init = True
+        else:
+            gmsh.finalize()
+            _is_gmsh_init = False
@@ -56,12 +56,15 @@ class WMachineTable(Ui_WMachineTable, QWidget):
             self.b_GMSH.setEnabled(False)
             self.b_GMSH.setWhatsThis(str(draw_GMSH))
             self.b_GMSH.setToolTip(str(draw_GMSH))
-
-            self.b_GMSH_3D.setEnabled(False)
-            self.b_GMSH_3D.setWhatsThis(str(gen_3D_mesh))
-            self.b_GMSH_3D.setToolTip(str(gen_3D_mesh))
         else:
             self.b_GMSH.clicked.connect(self.draw_GMSH)
+        # gen_3D_mesh imports gmsh only when called, draw_GMSH shows if it is missing
+        if isinstance(gen_3D_mesh, Exception) or isinstance(draw_GMSH, Exception):
+            error = gen_3D_mesh if isinstance(gen_3D_mesh, Exception) else draw_GMSH
+            self.b_GMSH_3D.setEnabled(False)
+            self.b_GMSH_3D.setWhatsThis(str(error))
+            self.b_GMSH_3D.setToolTip(str(error))
+        else:
             self.b_GMSH_3D.clicked.connect(self.draw_GMSH_3D)
         self.b_plot_machine.clicked.connect(self.plot_machine)
 
@@ -2,6 +2,7 @@ from os.path import join, dirname, isfile
 from PySide2.QtWidgets import QDialog, QMessageBox, QLayout
 from PySide2.QtCore import Qt, Signal
 from logging import getLogger
+from functools import partial
 from numpy import pi, array, array_equal
 
 from .....GUI.Dialog.DMatLib.DMatSetup.Gen_DMatSetup import Gen_DMatSetup
@@ -12,6 +13,9 @@ from .....Classes.ImportMatrixXls import ImportMatrixXls
 from .....Functions.path_tools import rel_file_path
 from .....loggers import GUI_LOG_NAME
 
+# Value of an undefined BH curve
+EMPTY_BH = array([[0, 0]])
+
 
 class DMatSetup(Gen_DMatSetup, QDialog):
     # Signal to DMatLib to update material treeview
@@ -50,36 +54,43 @@ class DMatSetup(Gen_DMatSetup, QDialog):
         # General
         self.le_name.editingFinished.connect(self.set_name)
         self.cb_material_type.currentIndexChanged.connect(self.set_is_isotropic)
-        # Elec
-        self.lf_rho_elec.editingFinished.connect(self.set_rho_elec)
-        # Magnetics
-        self.lf_mur_lin.editingFinished.connect(self.set_mur_lin)
-        self.lf_Brm20.editingFinished.connect(self.set_Brm20)
-        self.lf_alpha_Br.editingFinished.connect(self.set_alpha_Br)
-        self.lf_Wlam.editingFinished.connect(self.set_Wlam)
-        # Economical
-        self.lf_cost_unit.editingFinished.connect(self.set_cost_unit)
-        # Thermics
-        self.lf_Cp.editingFinished.connect(self.set_Cp)
-        self.lf_alpha.editingFinished.connect(self.set_alpha)
-        self.lf_L.editingFinished.connect(self.set_lambda)
-        self.lf_Lx.editingFinished.connect(self.set_lambda_x)
-        self.lf_Ly.editingFinished.connect(self.set_lambda_y)
-        self.lf_Lz.editingFinished.connect(self.set_lambda_z)
-        # Mechanics
-        self.lf_rho_meca.editingFinished.connect(self.set_rho_meca)
-        self.lf_E.editingFinished.connect(self.set_E)
-        self.lf_Ex.editingFinished.connect(self.set_Ex)
-        self.lf_Ey.editingFinished.connect(self.set_Ey)
-        self.lf_Ez.editingFinished.connect(self.set_Ez)
-        self.lf_G.editingFinished.connect(self.set_G)
-        self.lf_Gxy.editingFinished.connect(self.set_Gxy)
-        self.lf_Gxz.editingFinished.connect(self.set_Gxz)
-        self.lf_Gyz.editingFinished.connect(self.set_Gyz)
-        self.lf_nu.editingFinished.connect(self.set_nu)
-        self.lf_nu_xy.editingFinished.connect(self.set_nu_xy)
-        self.lf_nu_xz.editingFinished.connect(self.set_nu_xz)
-        self.lf_nu_yz.editingFinished.connect(self.set_nu_yz)
+        # Float fields: (widget, material attributes to update, scale)
+        field_list = [
+            # Elec
+            (self.lf_rho_elec, ["elec.rho"], 1),
+            # Magnetics
+            (self.lf_mur_lin, ["mag.mur_lin"], 1),
+            (self.lf_Brm20, ["mag.Brm20"], 1),
+            (self.lf_alpha_Br, ["mag.alpha_Br"], 1),
+            (self.lf_Wlam, ["mag.Wlam"], 1),
+            # Economical
+            (self.lf_cost_unit, ["eco.cost_unit"], 1),
+            # Thermics
+            (self.lf_Cp, ["HT.Cp"], 1),
+            (self.lf_alpha, ["HT.alpha"], 1),
+            (self.lf_L, ["HT.lambda_x", "HT.lambda_y", "HT.lambda_z"], 1),
+            (self.lf_Lx, ["HT.lambda_x"], 1),
+            (self.lf_Ly, ["HT.lambda_y"], 1),
+            (self.lf_Lz, ["HT.lambda_z"], 1),
+            # Mechanics
+            (self.lf_rho_meca, ["struct.rho"], 1),
+            (self.lf_E, ["struct.Ex", "struct.Ey", "struct.Ez"], 1e9),
+            (self.lf_Ex, ["struct.Ex"], 1e9),
+            (self.lf_Ey, ["struct.Ey"], 1e9),
+            (self.lf_Ez, ["struct.Ez"], 1e9),
+            (self.lf_G, ["struct.Gxy", "struct.Gxz", "struct.Gyz"], 1e9),
+            (self.lf_Gxy, ["struct.Gxy"], 1e9),
+            (self.lf_Gxz, ["struct.Gxz"], 1e9),
+            (self.lf_Gyz, ["struct.Gyz"], 1e9),
+            (self.lf_nu, ["struct.nu_xy", "struct.nu_xz", "struct.nu_yz"], 1),
+            (self.lf_nu_xy, ["struct.nu_xy"], 1),
+            (self.lf_nu_xz, ["struct.nu_xz"], 1),
+            (self.lf_nu_yz, ["struct.nu_yz"], 1),
+        ]
+        for widget, attr_list, scale in field_list:
+            widget.editingFinished.connect(
+                partial(self.set_mat_attr, widget, attr_list, scale)
+            )
         self.tab_values.saveNeeded.connect(self.set_table_values)
         self.c_type_material.currentIndexChanged.connect(self.change_type_material)
 
@@ -134,75 +145,55 @@ class DMatSetup(Gen_DMatSetup, QDialog):
             self.cb_material_type.setCurrentIndex(0)
 
         # === check material attribute and set values ===
-        # Elec
-        if self.mat.elec is None:
-            self.set_default("elec")
-        self.lf_rho_elec.setValue(self.mat.elec.rho)
-
-        # Economical
-        if self.mat.eco is None:
-            self.set_default("eco")
-        self.lf_cost_unit.setValue(self.mat.eco.cost_unit)
-
-        # Thermics
-        if self.mat.HT is None:
-            self.set_default("HT")
-        self.lf_Cp.setValue(self.mat.HT.Cp)
-        self.lf_alpha.setValue(self.mat.HT.alpha)
-        self.lf_L.setValue(self.mat.HT.lambda_x)
-        self.lf_Lx.setValue(self.mat.HT.lambda_x)
-        self.lf_Ly.setValue(self.mat.HT.lambda_y)
-        self.lf_Lz.setValue(self.mat.HT.lambda_z)
-        # Structural
-        if self.mat.struct is None:
-            self.set_default("struct")
-        self.lf_rho_meca.setValue(self.mat.struct.rho)
-
-        if self.mat.struct.Ex not in [0, None]:
-            self.lf_E.setValue(self.mat.struct.Ex / 1e9)
-            self.lf_Ex.setValue(self.mat.struct.Ex / 1e9)
-        else:
-            self.lf_E.setValue(self.mat.struct.Ex)
-            self.lf_Ex.setValue(self.mat.struct.Ex)
-        if self.mat.struct.Ey not in [0, None]:
-            self.lf_Ey.setValue(self.mat.struct.Ey / 1e9)
-        else:
-            self.lf_Ey.setValue(self.mat.struct.Ey)
-        if self.mat.struct.Ez not in [0, None]:
-            self.lf_Ez.setValue(self.mat.struct.Ez / 1e9)
-        else:
-            self.lf_Ez.setValue(self.mat.struct.Ez)
-        if self.mat.struct.Gxy not in [0, None]:
-            self.lf_G.setValue(self.mat.struct.Gxy / 1e9)
-            self.lf_Gxy.setValue(self.mat.struct.Gxy / 1e9)
-        else:
-            self.lf_G.setValue(self.mat.struct.Gxy)
-            self.lf_Gxy.setValue(self.mat.struct.Gxy)
-        if self.mat.struct.Gxz not in [0, None]:
-            self.lf_Gxz.setValue(self.mat.struct.Gxz / 1e9)
-        else:
-            self.lf_Gxz.setValue(self.mat.struct.Gxz)
-        if self.mat.struct.Gyz not in [0, None]:
-            self.lf_Gyz.setValue(self.mat.struct.Gyz / 1e9)
-        else:
-            self.lf_Gyz.setValue(self.mat.struct.Gyz)
-        self.lf_nu.setValue(self.mat.struct.nu_xy)
-        self.lf_nu_xy.setValue(self.mat.struct.nu_xy)
-        self.lf_nu_xz.setValue(self.mat.struct.nu_xz)
-        self.lf_nu_yz.setValue(self.mat.struct.nu_yz)
-
-        # Magnetical
-        if self.mat.mag is None:
-            self.set_default("mag")
-
-        self.lf_mur_lin.setValue(self.mat.mag.mur_lin)
-        self.lf_Brm20.setValue(self.mat.mag.Brm20)
-        self.lf_alpha_Br.setValue(self.mat.mag.alpha_Br)
-        self.lf_Wlam.setValue(self.mat.mag.Wlam)
+        for attr in ["elec", "eco", "HT", "struct", "mag"]:
+            if getattr(self.mat, attr) is None:
+                self.set_default(attr)
+
+        elec, eco, HT = self.mat.elec, self.mat.eco, self.mat.HT
+        struct, mag = self.mat.struct, self.mat.mag
+        # (widget, value, scale) the scale is applied only on defined values
+        update_list = [
+            # Elec
+            (self.lf_rho_elec, elec.rho, 1),
+            # Economical
+            (self.lf_cost_unit, eco.cost_unit, 1),
+            # Thermics
+            (self.lf_Cp, HT.Cp, 1),
+            (self.lf_alpha, HT.alpha, 1),
+            (self.lf_L, HT.lambda_x, 1),
+            (self.lf_Lx, HT.lambda_x, 1),
+            (self.lf_Ly, HT.lambda_y, 1),
+            (self.lf_Lz, HT.lambda_z, 1),
+            # Structural
+            (self.lf_rho_meca, struct.rho, 1),
+            (self.lf_E, struct.Ex, 1e-9),
+            (self.lf_Ex, struct.Ex, 1e-9),
+            (self.lf_Ey, struct.Ey, 1e-9),
+            (self.lf_Ez, struct.Ez, 1e-9),
+            (self.lf_G, struct.Gxy, 1e-9),
+            (self.lf_Gxy, struct.Gxy, 1e-9),
+            (self.lf_Gxz, struct.Gxz, 1e-9),
+            (self.lf_Gyz, struct.Gyz, 1e-9),
+            (self.lf_nu, struct.nu_xy, 1),
+            (self.lf_nu_xy, struct.nu_xy, 1),
+            (self.lf_nu_xz, struct.nu_xz, 1),
+            (self.lf_nu_yz, struct.nu_yz, 1),
+            # Magnetical
+            (self.lf_mur_lin, mag.mur_lin, 1),
+            (self.lf_Brm20, mag.Brm20, 1),
+            (self.lf_alpha_Br, mag.alpha_Br, 1),
+            (self.lf_Wlam, mag.Wlam, 1),
+        ]
+        # setValue doesn't emit editingFinished (no signal to block)
+        for widget, value, scale in update_list:
+            if value not in (0, None):
+                value = value * scale
+            widget.setValue(value)
+
         # Setup tab values
         if not isinstance(self.mat.mag.BH_curve, ImportMatrixVal):
             self.g_BH_import.setChecked(False)
-        elif array_equal(self.mat.mag.BH_curve.value, array([[0, 0]])):
+        elif array_equal(self.mat.mag.BH_curve.value, EMPTY_BH):
             self.g_BH_import.setChecked(False)
         else:
             self.g_BH_import.setChecked(True)
@@ -220,19 +211,21 @@ class DMatSetup(Gen_DMatSetup, QDialog):
         self.tab_values.b_import.setHidden(False)
         self.tab_values.b_export.setHidden(False)
 
+        # Read the BH curve data only once
+        if isinstance(self.mat.mag.BH_curve, (ImportMatrixXls, ImportMatrixVal)):
+            data = self.mat.mag.BH_curve.get_data()
+        else:
+            data = None
         if isinstance(self.mat.mag.BH_curve, ImportMatrixXls):
-            self.mat.mag.BH_curve = ImportMatrixVal(self.mat.mag.BH_curve.get_data())
-            self.tab_values.data = self.mat.mag.BH_curve.get_data()
-        elif not isinstance(self.mat.mag.BH_curve, ImportMatrixVal):
-            self.tab_values.data = array([[0, 0]])
-        elif self.mat.mag.BH_curve.get_data() is not None:
-            self.tab_values.data = self.mat.mag.BH_curve.get_data()
+            self.mat.mag.BH_curve = ImportMatrixVal(data)
+        if data is not None:
+            self.tab_values.data = data
         else:
             self.tab_values.data = array([[0, 0]])
         self.tab_values.update()
 
         if isinstance(self.mat.mag.BH_curve, ImportMatrixVal) and not array_equal(
-            self.mat.mag.BH_curve.value, array([[0, 0]])
+            self.mat.mag.BH_curve.value, EMPTY_BH
         ):
             self.c_type_material.setCurrentIndex(2)
         elif self.mat.mag.Brm20 != 0 and self.mat.mag.alpha_Br != 0:
@@ -350,414 +343,34 @@ class DMatSetup(Gen_DMatSetup, QDialog):
 
         self.set_save_needed(is_save_needed=True)
 
-    def set_rho_elec(self):
-        """Signal to update the value of rho_elec according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.elec.rho != self.lf_rho_elec.value():
-            self.mat.elec.rho = self.lf_rho_elec.value()
-            self.set_save_needed(is_save_needed=True)
-
-    def set_mur_lin(self):
-        """Signal to update the value of mur_lin according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.mag.mur_lin != self.lf_mur_lin.value():
-            self.mat.mag.mur_lin = self.lf_mur_lin.value()
-
-            self.set_save_needed(is_save_needed=True)
-
-    def set_Brm20(self):
-        """Signal to update the value of Brm20 according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.mag.Brm20 != self.lf_Brm20.value():
-            self.mat.mag.Brm20 = self.lf_Brm20.value()
-
-            self.set_save_needed(is_save_needed=True)
-
-    def set_alpha_Br(self):
-        """Signal to update the value of alpha_Br according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.mag.alpha_Br != self.lf_alpha_Br.value():
-            self.mat.mag.alpha_Br = self.lf_alpha_Br.value()
-            self.set_save_needed(is_save_needed=True)
-
-    def set_Wlam(self):
-        """Signal to update the value of Wlam according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.mag.Wlam != self.lf_Wlam.value():
-            self.mat.mag.Wlam = self.lf_Wlam.value()
-            self.set_save_needed(is_save_needed=True)
-
-    def set_cost_unit(self):
-        """Signal to update the value of cost_unit according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.eco.cost_unit != self.lf_cost_unit.value():
-            self.mat.eco.cost_unit = self.lf_cost_unit.value()
-            self.set_save_needed(is_save_needed=True)
-
-    def set_Cp(self):
-        """Signal to update the value of Cp according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.HT.Cp != self.lf_Cp.value():
-            self.mat.HT.Cp = self.lf_Cp.value()
-            self.set_save_needed(is_save_needed=True)
-
-    def set_alpha(self):
-        """Signal to update the value of alpha according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.HT.alpha != self.lf_alpha.value():
-            self.mat.HT.alpha = self.lf_alpha.value()
-            self.set_save_needed(is_save_needed=True)
-
-    def set_lambda(self):
-        """Signal to update the value of lambda according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.HT.lambda_x != self.lf_L.value():
-            self.mat.HT.lambda_x = self.lf_L.value()
-            self.mat.HT.lambda_y = self.lf_L.value()
-            self.mat.HT.lambda_z = self.lf_L.value()
-            self.set_save_needed(is_save_needed=True)
-
-    def set_lambda_x(self):
-        """Signal to update the value of lambda_x according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.HT.lambda_x != self.lf_Lx.value():
-            self.mat.HT.lambda_x = self.lf_Lx.value()
-            self.set_save_needed(is_save_needed=True)
-
-    def set_lambda_y(self):
-        """Signal to update the value of lambda_y according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.HT.lambda_y != self.lf_Ly.value():
-            self.mat.HT.lambda_y = self.lf_Ly.value()
-            self.set_save_needed(is_save_needed=True)
-
-    def set_lambda_z(self):
-        """Signal to update the value of lambda_z according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.HT.lambda_z != self.lf_Lz.value():
-            self.mat.HT.lambda_z = self.lf_Lz.value()
-            self.set_save_needed(is_save_needed=True)
-
-    def set_rho_meca(self):
-        """Signal to update the value of rho_meca according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.struct.rho != self.lf_rho_meca.value():
-            self.mat.struct.rho = self.lf_rho_meca.value()
-            self.set_save_needed(is_save_needed=True)
-
-    def set_E(self):
-        """Signal to update the value of Ex according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.struct.Ex != self.lf_E.value() * 1e9:
-            self.mat.struct.Ex = self.lf_E.value() * 1e9
-            self.mat.struct.Ey = self.lf_E.value() * 1e9
-            self.mat.struct.Ez = self.lf_E.value() * 1e9
-            self.set_save_needed(is_save_needed=True)
-
-    def set_Ex(self):
-        """Signal to update the value of Ex according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.struct.Ex != self.lf_Ex.value() * 1e9:
-            self.mat.struct.Ex = self.lf_Ex.value() * 1e9
-            self.set_save_needed(is_save_needed=True)
-
-    def set_Ey(self):
-        """Signal to update the value of Ey according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.struct.Ey != self.lf_Ey.value() * 1e9:
-            self.mat.struct.Ey = self.lf_Ey.value() * 1e9
-            self.set_save_needed(is_save_needed=True)
-
-    def set_Ez(self):
-        """Signal to update the value of Ez according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.struct.Ez != self.lf_Ez.value() * 1e9:
-            self.mat.struct.Ez = self.lf_Ez.value() * 1e9
-            self.set_save_needed(is_save_needed=True)
-
-    def set_G(self):
-        """Signal to update the value of G according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.struct.Gxy != self.lf_G.value() * 1e9:
-            self.mat.struct.Gxy = self.lf_G.value() * 1e9
-            self.mat.struct.Gxz = self.lf_G.value() * 1e9
-            self.mat.struct.Gyz = self.lf_G.value() * 1e9
-            self.set_save_needed(is_save_needed=True)
-
-    def set_Gxy(self):
-        """Signal to update the value of Gxy according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.struct.Gxy != self.lf_Gxy.value() * 1e9:
-            self.mat.struct.Gxy = self.lf_Gxy.value() * 1e9
-            self.set_save_needed(is_save_needed=True)
-
-    def set_Gxz(self):
-        """Signal to update the value of Gxz according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.struct.Gxz != self.lf_Gxz.value() * 1e9:
-            self.mat.struct.Gxz = self.lf_Gxz.value() * 1e9
-            self.set_save_needed(is_save_needed=True)
-
-    def set_Gyz(self):
-        """Signal to update the value of Gyz according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.struct.Gyz != self.lf_Gyz.value() * 1e9:
-            self.mat.struct.Gyz = self.lf_Gyz.value() * 1e9
-            self.set_save_needed(is_save_needed=True)
-
-    def set_nu(self):
-        """Signal to update the value of nu_xy according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.struct.nu_xy != self.lf_nu.value():
-            self.mat.struct.nu_xy = self.lf_nu.value()
-            self.mat.struct.nu_xz = self.lf_nu.value()
-            self.mat.struct.nu_yz = self.lf_nu.value()
-            self.set_save_needed(is_save_needed=True)
-
-    def set_nu_xy(self):
-        """Signal to update the value of nu_xy according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.struct.nu_xy != self.lf_nu_xy.value():
-            self.mat.struct.nu_xy = self.lf_nu_xy.value()
-            self.set_save_needed(is_save_needed=True)
-
-    def set_nu_xz(self):
-        """Signal to update the value of nu_xz according to the line edit
-
-        Parameters
-        ----------
-        self :
-            A DMatSetup object
-
-        Returns
-        -------
-        None
-        """
-        if self.mat.struct.nu_xz != self.lf_nu_xz.value():
-            self.mat.struct.nu_xz = self.lf_nu_xz.value()
-            self.set_save_needed(is_save_needed=True)
-
-    def set_nu_yz(self):
-        """Signal to update the value of nu_yz according to the line edit
+    def set_mat_attr(self, widget, attr_list, scale=1):
+        """Signal to update material attributes according to a line edit
 
         Parameters
         ----------
         self :
             A DMatSetup object
+        widget : FloatEdit
+            Line edit to read the value from
+        attr_list : list
+            Material attributes to update (ex: "struct.Ex"), the first one is
+            used to detect a modification
+        scale : float
+            Scale to apply on the widget value
 
         Returns
         -------
         None
         """
-        if self.mat.struct.nu_yz != self.lf_nu_yz.value():
-            self.mat.struct.nu_yz = self.lf_nu_yz.value()
+        value = widget.value()
+        if value is not None:
+            value = value * scale
+        # Split each "obj.attr" path once for both the read and the write
+        path_list = [attr.split(".") for attr in attr_list]
+        obj_name, attr_name = path_list[0]
+        if getattr(getattr(self.mat, obj_name), attr_name) != value:
+            for obj_name, attr_name in path_list:
+                setattr(getattr(self.mat, obj_name), attr_name, value)
             self.set_save_needed(is_save_needed=True)
 
     def set_table_values(self):
@@ -772,12 +385,14 @@ class DMatSetup(Gen_DMatSetup, QDialog):
         -------
         None
         """
+        # Read the table only once (one query per cell widget)
+        data = self.tab_values.get_data()
         if isinstance(self.mat.mag.BH_curve, ImportMatrixVal):
-            if not array_equal(self.mat.mag.BH_curve.value, self.tab_values.get_data()):
-                self.mat.mag.BH_curve.value = self.tab_values.get_data()
+            if not array_equal(self.mat.mag.BH_curve.value, data):
+                self.mat.mag.BH_curve.value = data
                 self.set_save_needed(is_save_needed=True)
         elif isinstance(self.mat.mag.BH_curve, (ImportMatrixXls, ImportMatrix)):
-            self.mat.mag.BH_curve = ImportMatrixVal(self.tab_values.get_data())
+            self.mat.mag.BH_curve = ImportMatrixVal(data)
             self.set_save_needed(is_save_needed=True)
 
     def change_type_material(self):
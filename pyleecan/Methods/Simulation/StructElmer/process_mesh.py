@@ -4,6 +4,7 @@ import sys
 
 from os import replace
 from os.path import splitext
+from ....Functions.GMSH.gen_3D_mesh import close_gmsh_session
 from ....Functions.labels import (
     SHAFT_LAB,
     decode_label,
@@ -98,6 +99,7 @@ def process_mesh(
     """Preprocess the GMSH model, i.e. remove unused parts, rename boundaries, ..."""
     # TODO utilize 'translation' dict
 
+    close_gmsh_session()  # Don't reuse the gen_3D_mesh session
     gmsh.initialize()
     gmsh.open(file_in)
     gmsh.model.geo.removeAllDuplicates()